@@ -1,31 +1,50 @@
+import numpy as np
 import streamlit as st
 
 # ---------- Scoring Functions (Updated & Fair) ----------
+# Each scorer accepts a scalar or a NumPy array, so the same code scores
+# one applicant or a whole portfolio in a single vectorized pass.
 
 def score_credit_score(cs):
-    return (cs - 300) / 550 * 100
+    return (np.asarray(cs, dtype=float) - 300) / 550 * 100
 
 def score_income(income):
-    income = max(income, 20000)
+    income = np.maximum(income, 20000)
     raw = (income - 20000) / (150000 - 20000)
     return raw * 80 + 20  # Score range: 20 to 100
 
 def score_employment(emp_years):
-    raw_score = (emp_years / 30) * 100
-    return max(raw_score, 20)  # Min employment score = 20
+    raw_score = (np.asarray(emp_years, dtype=float) / 30) * 100
+    return np.maximum(raw_score, 20)  # Min employment score = 20
 
 def score_existing_loans(loans):
-    return max((5 - loans) / 5 * 100, 0)  # 0 loans = 100, 5 loans = 0
+    return np.maximum((5 - np.asarray(loans, dtype=float)) / 5 * 100, 0)  # 0 loans = 100, 5 loans = 0
 
 def score_age(age):
-    if 25 <= age <= 55:
-        return 100
-    elif 21 <= age < 25:
-        return 90
-    elif 18 <= age < 21:
-        return 75
-    else:
-        return 50
+    age = np.asarray(age)
+    return np.select(
+        [(age >= 25) & (age <= 55), (age >= 21) & (age < 25), (age >= 18) & (age < 21)],
+        [100.0, 90.0, 75.0],
+        default=50.0,
+    )
+
+# Feature keys and weights, in the column order produced by score_components
+KEYS = ('credit_score', 'income', 'employment', 'loans', 'age')
+WEIGHTS = np.array([0.4, 0.2, 0.15, 0.15, 0.1])
+
+def score_components(credit_score, income, employment_length, existing_loans, age):
+    """Stack the component scores into a (5,) array, or (N, 5) for array inputs."""
+    return np.stack([
+        score_credit_score(credit_score),
+        score_income(income),
+        score_employment(employment_length),
+        score_existing_loans(existing_loans),
+        score_age(age)
+    ], axis=-1).astype(float)
+
+def total_scores(components):
+    """Weighted total score for each row of score_components output."""
+    return components @ WEIGHTS
 
 # ---------- Risk Classification Logic ----------
 def classify_risk(score):
@@ -51,26 +70,9 @@ def main():
         submitted = st.form_submit_button("Evaluate Risk")
 
     if submitted:
-        # Score each input
-        scores = {
-            'credit_score': score_credit_score(credit_score),
-            'income': score_income(income),
-            'employment': score_employment(employment_length),
-            'loans': score_existing_loans(existing_loans),
-            'age': score_age(age)
-        }
-
-        # Feature weights
-        weights = {
-            'credit_score': 0.4,
-            'income': 0.2,
-            'employment': 0.15,
-            'loans': 0.15,
-            'age': 0.1
-        }
-
-        # Compute weighted total score
-        total_score = sum(scores[k] * weights[k] for k in scores)
+        # Score each input and compute weighted total score
+        components = score_components(credit_score, income, employment_length, existing_loans, age)
+        total_score = float(total_scores(components))
         risk_level = classify_risk(total_score)
 
         # Results
@@ -82,9 +84,9 @@ def main():
         # Detailed Breakdown
         st.markdown("---")
         st.subheader("Score Breakdown")
-        for k in scores:
+        for k, score, weight in zip(KEYS, components, WEIGHTS):
             label = k.replace('_', ' ').title()
-            st.write(f"**{label}**: {scores[k]:.1f} (Weight: {weights[k]*100:.0f}%)")
+            st.write(f"**{label}**: {score:.1f} (Weight: {weight*100:.0f}%)")
 
 if __name__ == "__main__":
     main()